@@ -3,7 +3,7 @@
 import os
 import subprocess
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class TigsRepo:
@@ -21,13 +21,47 @@ class TigsRepo:
     def _verify_git_repo(self) -> None:
         """Verify that we're in a Git repository."""
         result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
+            ["git", "rev-parse", "--git-common-dir"],
             cwd=self.repo_path,
             capture_output=True,
             text=True,
         )
         if result.returncode != 0:
             raise ValueError(f"Not a Git repository: {self.repo_path}")
+        # Where refs live, shared by all worktrees; relative paths are
+        # relative to repo_path, which may be a subdirectory
+        self._git_common_dir = self.repo_path / result.stdout.strip()
+
+    def refs_fingerprint(self, namespace: str = "refs") -> Optional[Tuple]:
+        """Identify the current state of a ref namespace without running git.
+
+        Git writes a ref through a lock file renamed into the ref's
+        directory, so creating, moving or deleting a loose ref changes that
+        directory's mtime, and packing refs replaces packed-refs.
+
+        Args:
+            namespace: Ref directory to cover, e.g. "refs/notes"
+
+        Returns:
+            Tuple of (path, inode, mtime) for packed-refs and every directory
+            under the namespace, or None if the ref storage can't be inspected
+            directly (reftable repositories)
+        """
+        if (self._git_common_dir / "reftable").is_dir():
+            return None
+
+        root = os.path.join(self._git_common_dir, namespace)
+        paths = [os.path.join(self._git_common_dir, "packed-refs"), root]
+        paths.extend(dirpath for dirpath, _, _ in os.walk(root) if dirpath != root)
+        fingerprint = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                fingerprint.append((path, None))
+            else:
+                fingerprint.append((path, stat.st_ino, stat.st_mtime_ns))
+        return tuple(fingerprint)
 
     def _run_git(self, args: List[str]) -> subprocess.CompletedProcess:
         """Run a Git command and return the result."""
@@ -110,12 +144,9 @@ class TigsRepo:
         """
         try:
             result = self._run_git(["notes", "--ref=refs/notes/chats", "list"])
-            if not result.stdout.strip():
-                return []
 
             # Parse output: each line is "note_blob_sha commit_sha"
-            lines = result.stdout.strip().split("\n")
-            return [line.split()[1] for line in lines if line.strip()]
+            return [line.split()[1] for line in result.stdout.splitlines() if line]
         except subprocess.CalledProcessError:
             return []
 
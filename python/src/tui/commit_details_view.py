@@ -1,8 +1,11 @@
 """Commit details view for displaying full commit information."""
 
 import curses
+import re
 import subprocess
-from typing import List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from .text_utils import word_wrap
 from .view_scroll_mixin import ViewScrollMixin
 from .color_constants import (
@@ -16,6 +19,165 @@ from .color_constants import (
 )
 
 
+# Number of recently viewed commits whose details are kept in memory
+DETAILS_CACHE_SIZE = 64
+
+# Marker color for file stats lines, which are rendered with multiple colors
+FILE_STATS_COLOR = -1
+
+# Runs of "+", runs of "-", and runs of anything else in a file stats graph
+_CHANGE_RUN_RE = re.compile(r"\++|-+|[^+-]+")
+
+# Sections of the commit details output, in the order they appear
+_HEADER, _MESSAGE, _STATS = range(3)
+
+# Colors of header lines, keyed by the line's first word
+_HEADER_COLORS = {
+    "commit": COLOR_COMMIT,  # Green for entire commit line including SHA
+    "Author:": COLOR_AUTHOR,  # Cyan for entire author line including email
+    "Date:": COLOR_DATE,  # Yellow for entire date line including time
+    "Refs:": COLOR_REFS,  # Magenta for refs
+}
+
+# Ref namespaces shown in the Refs line and how each is decorated
+_REF_FORMATS = (
+    ("refs/heads/", "[{}]"),
+    ("refs/tags/", "<{}>"),
+    ("refs/remotes/", "{{{}}}"),
+)
+
+
+def _format_ref(ref_name: str) -> Optional[str]:
+    """Format a full ref name for the Refs line.
+
+    Args:
+        ref_name: Full ref name, e.g. "refs/heads/main"
+
+    Returns:
+        Decorated short name, or None for refs outside the shown namespaces
+    """
+    for prefix, template in _REF_FORMATS:
+        if ref_name.startswith(prefix):
+            return template.format(ref_name[len(prefix) :])
+    return None
+
+
+def _file_stats_pipe_index(line: str) -> int:
+    """Find the separator of a file stats line (not a commit message line with |).
+
+    File stats lines have the format:
+    - Start with single space (not 4 spaces like commit messages)
+    - Have " | " separator
+    - After separator have numbers, +/-, "Bin", or just 0
+
+    Args:
+        line: Line to check
+
+    Returns:
+        Index of the " | " separator, or -1 if this is not a file stats line
+    """
+    pipe_idx = line.find(" | ")
+    # Commit message lines are indented with 4 spaces
+    # File stats lines typically have 1 space
+    if pipe_idx < 0 or line.startswith("    "):
+        return -1
+
+    # Find the first non-space character after " | " without slicing
+    i = pipe_idx + 3
+    n = len(line)
+    while i < n and line[i].isspace():
+        i += 1
+
+    # File stats have numbers, +/-, Bin, or combinations
+    if i == n:
+        return -1
+
+    # Check for typical file stats patterns:
+    # numbers (including 0 for renames), binary files, or direct +/-
+    c = line[i]
+    if c.isdigit() or c in "+-" or line.startswith("Bin", i):
+        return pipe_idx
+
+    return -1
+
+
+@lru_cache(maxsize=4096)
+def _classify_line(line: str) -> Tuple[int, Optional[Tuple[str, str]]]:
+    """Determine the color of a raw details line.
+
+    Results are memoized per unique line, so repeated lines (blank lines,
+    headers of previously viewed commits) are classified only once.
+
+    Args:
+        line: Raw (unwrapped) details line
+
+    Returns:
+        Tuple of (color_pair, file_stats_data) where file_stats_data is
+        (filename_part, changes_part) for file stats lines, None otherwise
+    """
+    if line.startswith("    "):
+        # Commit message body, never a header or stats line
+        return COLOR_DEFAULT, None
+
+    # Header lines color the whole line by their leading word
+    header_color = _HEADER_COLORS.get(line.partition(" ")[0])
+    if header_color is not None:
+        return header_color, None
+    pipe_idx = _file_stats_pipe_index(line)
+    if pipe_idx >= 0:
+        # File stats line - will need special handling for multi-color
+        # This includes regular changes, binary files, and renames with 0 changes
+        return FILE_STATS_COLOR, (line[: pipe_idx + 3], line[pipe_idx + 3 :])
+    if "file changed" in line or "files changed" in line:
+        # Summary line
+        if "insertions(+)" in line and "deletions(-)" not in line:
+            return COLOR_COMMIT, None  # Green for only insertions
+        if "deletions(-)" in line and "insertions(+)" not in line:
+            return COLOR_DELETE, None  # Red for only deletions
+    return COLOR_DEFAULT, None
+
+
+@lru_cache(maxsize=4096)
+def _change_runs(changes: str) -> Tuple[Tuple[str, int], ...]:
+    """Split the changes part of a file stats line into colored runs.
+
+    Consecutive characters with the same color are combined, so the result
+    is ready to be appended to a line's parts. Memoized per changes text
+    since the graph of a commit never changes between renders.
+
+    Args:
+        changes: Text after the " | " separator (e.g. "10 +++---")
+
+    Returns:
+        Tuple of (text, color_pair) runs
+    """
+    runs = []
+    for match in _CHANGE_RUN_RE.finditer(changes):
+        text = match.group()
+        if text[0] == "+":
+            color = COLOR_COMMIT  # Green for +
+        elif text[0] == "-":
+            color = COLOR_DELETE  # Red for -
+        else:
+            color = COLOR_DEFAULT  # Default for other chars
+        runs.append((text, color))
+    return tuple(runs)
+
+
+@lru_cache(maxsize=4096)
+def _wrap_line(line: str, width: int) -> Tuple[str, ...]:
+    """Word wrap a raw details line, memoized per (line, width).
+
+    Args:
+        line: Raw (unwrapped) details line
+        width: Available content width
+
+    Returns:
+        Tuple of wrapped line parts
+    """
+    return tuple(word_wrap(line, width))
+
+
 class CommitDetailsView(ViewScrollMixin):
     """Displays detailed commit information including message and changed files."""
 
@@ -28,6 +190,20 @@ class CommitDetailsView(ViewScrollMixin):
         ViewScrollMixin.__init__(self)
         self.store = store
         self.current_sha = None
+        self._raw_lines: List[str] = []  # Unwrapped lines of the loaded commit
+        # (color_pair, file_stats_data) for each unwrapped line
+        self._raw_line_classes: List[Tuple[int, Optional[Tuple[str, str]]]] = []
+        self._formatted_lines: List[str] = []  # Lines wrapped per _wrapped_for
+        self._line_sources: List[int] = []  # Raw line index per formatted line
+        self._content_version = 0  # Bumped whenever new lines are loaded
+        # (width, content version) that _formatted_lines was built for
+        self._wrapped_for: Optional[Tuple[int, int]] = None
+        # Parsed details of recently viewed commits, least recent first
+        self._details_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        # Formatted ref names by commit SHA, loaded on first use
+        self._refs_by_sha: Optional[Dict[str, List[str]]] = None
+        # store.refs_fingerprint() at the time the cached refs were current
+        self._refs_fingerprint_loaded: Optional[Tuple] = None
 
     def load_commit_details(self, sha: str) -> None:
         """Load detailed information for a commit.
@@ -40,10 +216,27 @@ class CommitDetailsView(ViewScrollMixin):
 
         self.current_sha = sha
 
+        # Branches and tags may have moved since the refs were read; without
+        # a fingerprint there is no telling, so read them again
+        refs_fingerprint = self.store.refs_fingerprint()
+        if (
+            refs_fingerprint is None
+            or refs_fingerprint != self._refs_fingerprint_loaded
+        ):
+            self.invalidate_refs()
+            self._refs_fingerprint_loaded = refs_fingerprint
+
+        cached_lines = self._details_cache.get(sha)
+        if cached_lines is not None:
+            self._details_cache.move_to_end(sha)
+            self._set_raw_lines(cached_lines)
+            return
+
         try:
-            # Get commit information using git show
+            # Get commit information for just this commit; --cc keeps the
+            # stat that git show prints for merge commits
             result = subprocess.run(
-                ["git", "show", "--stat", "--format=fuller", sha],
+                ["git", "log", "-1", "--cc", "--stat", "--format=fuller", sha],
                 cwd=self.store.repo_path,
                 capture_output=True,
                 text=True,
@@ -55,153 +248,147 @@ class CommitDetailsView(ViewScrollMixin):
                 self.details_lines = ["Error loading commit details"]
                 return
 
-            # Parse the output
-            lines = result.stdout.split("\n")
-            formatted_lines = []
-
-            # Process commit header
-            in_header = True
-            in_message = False
-            message_lines = []
-
-            for line in lines:
-                if in_header:
-                    if line.startswith("commit "):
-                        # Commit SHA line
-                        formatted_lines.append(line)
-                    elif line.startswith("Author:"):
-                        # Author line
-                        formatted_lines.append(line)
-                    elif line.startswith("AuthorDate:"):
-                        # Extract just the date part
-                        date_part = line.replace("AuthorDate:", "Date:")
-                        formatted_lines.append(date_part)
-                    elif line.startswith("Commit:") or line.startswith("CommitDate:"):
-                        # Skip commit/commit date (we show author date)
-                        continue
-                    elif line == "":
-                        if not in_message:
-                            # Empty line before commit message
-                            in_header = False
-                            in_message = True
-                            formatted_lines.append("")
-                        else:
-                            # Empty line in message
-                            message_lines.append("")
-                    else:
-                        # Part of header we want to keep
-                        formatted_lines.append(line)
-                elif in_message:
-                    if line and not line[0].isspace() and "|" in line:
-                        # Reached the file stats section
-                        in_message = False
-                        # Add the collected message
-                        for msg_line in message_lines:
-                            formatted_lines.append(msg_line)
-                        formatted_lines.append("")
-                        formatted_lines.append(line)
-                    else:
-                        # Part of commit message
-                        message_lines.append(line)
-                else:
-                    # File stats section
-                    formatted_lines.append(line)
+            # Also get refs (branches and tags) for this commit
+            refs = self._get_refs_by_sha().get(sha, [])
 
-            # If we never hit the stats section, add remaining message lines
-            if in_message and message_lines:
-                for msg_line in message_lines:
-                    formatted_lines.append(msg_line)
+            # Split on newlines only (commit messages may contain other line
+            # breaks); the final newline leaves an empty element behind
+            output_lines = result.stdout.split("\n")
+            if output_lines and not output_lines[-1]:
+                output_lines.pop()
 
-            # Also get refs (branches and tags) for this commit
-            refs_result = subprocess.run(
-                ["git", "show-ref", "--dereference"],
-                cwd=self.store.repo_path,
-                capture_output=True,
-                text=True,
-            )
+            # Parse the output, placing the refs right after the commit line
+            formatted_lines = self._parse_show_output(output_lines, refs)
 
-            if refs_result.returncode == 0:
-                refs = []
-                for ref_line in refs_result.stdout.split("\n"):
-                    if sha in ref_line:
-                        # Extract ref name
-                        parts = ref_line.split()
-                        if len(parts) >= 2:
-                            ref_name = parts[1]
-                            if ref_name.startswith("refs/heads/"):
-                                refs.append(f"[{ref_name.replace('refs/heads/', '')}]")
-                            elif ref_name.startswith("refs/tags/"):
-                                refs.append(f"<{ref_name.replace('refs/tags/', '')}>")
-                            elif ref_name.startswith("refs/remotes/"):
-                                refs.append(
-                                    f"{{{ref_name.replace('refs/remotes/', '')}}}"
-                                )
-
-                if refs:
-                    # Insert refs after commit line
-                    for i, line in enumerate(formatted_lines):
-                        if line.startswith("commit "):
-                            refs_line = f"Refs: {', '.join(refs)}"
-                            formatted_lines.insert(i + 1, refs_line)
-                            break
-
-            # Store all formatted lines without truncation
-            self.total_lines = formatted_lines
-            # Reset view to top when loading new content
-            self.reset_view()
-            # Clear cached formatted lines to force re-wrapping
-            if hasattr(self, "_formatted_lines"):
-                del self._formatted_lines
-            if hasattr(self, "_line_colors"):
-                del self._line_colors
-            if hasattr(self, "_file_stats_info"):
-                del self._file_stats_info
+            # Remember the details so revisiting the commit skips git
+            self._details_cache[sha] = formatted_lines
+            if len(self._details_cache) > DETAILS_CACHE_SIZE:
+                self._details_cache.popitem(last=False)
+
+            self._set_raw_lines(formatted_lines)
 
         except Exception as e:
-            self.total_lines = [f"Error: {str(e)}"]
+            self._set_raw_lines([f"Error: {str(e)}"])
+
+    def invalidate_refs(self) -> None:
+        """Forget cached refs so they are re-read from git on the next load.
+
+        Cached commit details are dropped as well, since they include the
+        refs line.
+        """
+        self._refs_by_sha = None
+        self._details_cache.clear()
+
+    def _get_refs_by_sha(self) -> Dict[str, List[str]]:
+        """Get formatted ref names for every commit that has refs.
 
-    def _is_file_stats_line(self, line: str) -> bool:
-        """Check if a line is a file stats line (not a commit message line with |).
+        All refs are read with a single git call on first use and cached
+        until invalidate_refs() is called, which load_commit_details does
+        whenever the refs on disk change.
 
-        File stats lines have the format:
-        - Start with single space (not 4 spaces like commit messages)
-        - Have " | " separator
-        - After separator have numbers, +/-, "Bin", or just 0
+        Returns:
+            Dictionary mapping commit SHAs to formatted ref names
+        """
+        if self._refs_by_sha is not None:
+            return self._refs_by_sha
+
+        refs_by_sha: Dict[str, List[str]] = {}
+        result = subprocess.run(
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(objectname) %(refname) %(*objectname)",
+            ],
+            cwd=self.store.repo_path,
+            capture_output=True,
+            text=True,
+        )
+
+        if result.returncode == 0:
+            for ref_line in result.stdout.splitlines():
+                parts = ref_line.split()
+                if len(parts) < 2:
+                    continue
+                label = _format_ref(parts[1])
+                if label:
+                    # Annotated tags point at the commit through their peeled SHA
+                    target = parts[2] if len(parts) > 2 else parts[0]
+                    refs_by_sha.setdefault(target, []).append(label)
+
+        self._refs_by_sha = refs_by_sha
+        return refs_by_sha
+
+    def _set_raw_lines(self, lines: List[str]) -> None:
+        """Show a new set of unwrapped detail lines from the top.
 
         Args:
-            line: Line to check
+            lines: Unwrapped lines to display
+        """
+        # Store all formatted lines without truncation
+        self._raw_lines = lines
+        self.total_lines = lines
+        # Classify once per load; re-wrapping for a new width reuses this
+        self._raw_line_classes = [_classify_line(line) for line in lines]
+        # Reset view to top when loading new content
+        self.reset_view()
+        # New content needs wrapping on the next render
+        self._content_version += 1
+
+    def _parse_show_output(
+        self, lines: Iterable[str], refs: Optional[List[str]] = None
+    ) -> List[str]:
+        """Parse `git log -1 --stat --format=fuller` output into display lines.
+
+        Lines are consumed one at a time, so any line iterable can be
+        passed in.
+
+        Args:
+            lines: Output lines, with or without trailing newlines
+            refs: Formatted ref names to show right after the commit line
 
         Returns:
-            True if this is a file stats line, False otherwise
+            List of display lines for the commit header, message and stats
         """
-        if " | " not in line:
-            return False
-
-        # Commit message lines are indented with 4 spaces
-        # File stats lines typically have 1 space
-        if line.startswith("    "):
-            return False
-
-        # Check the part after " | "
-        pipe_idx = line.index(" | ")
-        after_pipe = line[pipe_idx + 3 :].strip()
-
-        # File stats have numbers, +/-, Bin, or combinations
-        if not after_pipe:
-            return False
-
-        # Check for typical file stats patterns
-        # Numbers (including 0 for renames)
-        if after_pipe[0].isdigit():
-            return True
-        # Binary files
-        if after_pipe.startswith("Bin"):
-            return True
-        # Direct +/- (rare but possible)
-        if after_pipe[0] in "+-":
-            return True
+        formatted_lines = []
+        state = _HEADER
 
-        return False
+        for line in lines:
+            line = line.rstrip("\n")
+            if state == _HEADER:
+                if line.startswith("commit "):
+                    # Commit SHA line, followed by its branches and tags
+                    formatted_lines.append(line)
+                    if refs:
+                        formatted_lines.append(f"Refs: {', '.join(refs)}")
+                elif line.startswith("Author:"):
+                    # Author line
+                    formatted_lines.append(line)
+                elif line.startswith("AuthorDate:"):
+                    # Extract just the date part
+                    date_part = line.replace("AuthorDate:", "Date:")
+                    formatted_lines.append(date_part)
+                elif line.startswith("Commit:") or line.startswith("CommitDate:"):
+                    # Skip commit/commit date (we show author date)
+                    continue
+                elif line == "":
+                    # Empty line before commit message
+                    state = _MESSAGE
+                    formatted_lines.append("")
+                else:
+                    # Part of header we want to keep
+                    formatted_lines.append(line)
+            elif state == _MESSAGE:
+                if line and not line[0].isspace() and "|" in line:
+                    # Reached the file stats section
+                    state = _STATS
+                    formatted_lines.append("")
+                # Message and first stats line are emitted as-is
+                formatted_lines.append(line)
+            else:
+                # File stats section
+                formatted_lines.append(line)
+
+        return formatted_lines
 
     def handle_input(self, key: int, pane_height: int) -> bool:
         """Handle keyboard input for scrolling.
@@ -239,75 +426,24 @@ class CommitDetailsView(ViewScrollMixin):
             return ["Loading..."]
 
         # Format lines to fit width and track colors if needed
-        if (
-            not hasattr(self, "_formatted_lines")
-            or self._last_width != width
-            or not hasattr(self, "_line_colors")
-        ):
+        wrap_key = (width, self._content_version)
+        if self._wrapped_for != wrap_key:
             self._formatted_lines = []
-            self._line_colors = []  # Track color for each formatted line
-            self._file_stats_info = []  # Track original file stats info for wrapped lines
-
-            for line in self.total_lines:
-                # Determine color for this line before wrapping
-                color_pair = COLOR_DEFAULT  # Default color
-                file_stats_data = (
-                    None  # Will store (filename, changes) for file stats lines
-                )
+            # Index of the unwrapped line each formatted line came from, so
+            # colors can be worked out later for the visible lines only
+            self._line_sources = []
 
-                # Always calculate colors, we'll decide whether to use them later
-                line_stripped = line.lstrip()
-
-                if line.startswith("commit "):
-                    color_pair = (
-                        COLOR_COMMIT  # Green for entire commit line including SHA
-                    )
-                elif line_stripped.startswith("Author:"):
-                    color_pair = (
-                        COLOR_AUTHOR  # Cyan for entire author line including email
-                    )
-                elif line_stripped.startswith("Date:"):
-                    color_pair = (
-                        COLOR_DATE  # Yellow for entire date line including time
-                    )
-                elif line_stripped.startswith("Refs:"):
-                    color_pair = COLOR_REFS  # Magenta for refs
-                elif " | " in line and self._is_file_stats_line(line):
-                    # File stats line - will need special handling for multi-color
-                    # This includes regular changes, binary files, and renames with 0 changes
-                    # Mark it with a special color to identify it later
-                    color_pair = -1  # Special marker for file stats lines
-                    # Store the file stats data for wrapped lines
-                    pipe_idx = line.index(" | ")
-                    file_stats_data = (line[: pipe_idx + 3], line[pipe_idx + 3 :])
-                elif "file changed" in line or "files changed" in line:
-                    # Summary line
-                    if "insertions(+)" in line and "deletions(-)" not in line:
-                        color_pair = COLOR_COMMIT  # Green for only insertions
-                    elif "deletions(-)" in line and "insertions(+)" not in line:
-                        color_pair = COLOR_DELETE  # Red for only deletions
-                    else:
-                        color_pair = COLOR_DEFAULT  # Default for mixed
-
-                # Now wrap the line and apply the same color to all wrapped parts
+            for source_idx, line in enumerate(self._raw_lines):
                 if len(line) <= width - 4:
                     self._formatted_lines.append(line)
-                    self._line_colors.append(color_pair)
-                    self._file_stats_info.append(file_stats_data)
+                    self._line_sources.append(source_idx)
                 else:
-                    # Word wrap long lines
-                    wrapped = word_wrap(line, width - 4)
-                    for i, wrapped_line in enumerate(wrapped):
-                        self._formatted_lines.append(wrapped_line)
-                        self._line_colors.append(
-                            color_pair
-                        )  # Same color for wrapped parts
-                        # For file stats lines, store the original data for all wrapped parts
-                        self._file_stats_info.append(
-                            file_stats_data if color_pair == -1 else None
-                        )
-
-            self._last_width = width
+                    # Word wrap long lines; all parts share the source line
+                    wrapped = _wrap_line(line, width - 4)
+                    self._formatted_lines.extend(wrapped)
+                    self._line_sources.extend([source_idx] * len(wrapped))
+
+            self._wrapped_for = wrap_key
             # Update total_lines to use formatted version
             self.total_lines = self._formatted_lines
 
@@ -319,34 +455,26 @@ class CommitDetailsView(ViewScrollMixin):
         if colors_enabled:
             colored_lines = []
             for i, line in enumerate(visible_lines):
-                # Get the color for this line from our pre-calculated colors
+                # Wrapped parts share the color of their source line
                 line_idx = start_idx + i
-                if line_idx < len(self._line_colors):
-                    color_pair = self._line_colors[line_idx]
+                if line_idx < len(self._line_sources):
+                    source_idx = self._line_sources[line_idx]
+                    color_pair, file_stats_data = self._raw_line_classes[source_idx]
                 else:
-                    color_pair = COLOR_DEFAULT
-
-                # Check if this is a file stats line (original or wrapped)
-                file_stats_data = None
-                if line_idx < len(self._file_stats_info):
-                    file_stats_data = self._file_stats_info[line_idx]
+                    color_pair, file_stats_data = COLOR_DEFAULT, None
 
                 # Special handling for file stats lines
-                if color_pair == -1 and file_stats_data:
+                if color_pair == FILE_STATS_COLOR and file_stats_data:
                     parts = []
                     filename_part, changes_part = file_stats_data
 
                     # Check what part of the file stats this line represents
-                    if " | " in line:
+                    actual_filename, sep, actual_changes = line.partition(" | ")
+                    if sep:
                         # This is the line with the separator
-                        pipe_idx = line.index(" | ")
-                        actual_filename = line[: pipe_idx + 3]  # Include " | "
                         parts.append(
-                            (actual_filename, COLOR_METADATA)
-                        )  # Blue for filename
-
-                        # Changes part after the pipe
-                        actual_changes = line[pipe_idx + 3 :]
+                            (actual_filename + sep, COLOR_METADATA)
+                        )  # Blue for filename, including " | "
                     elif "+" in changes_part or "-" in changes_part:
                         # Check if this line is part of the filename or the changes
                         # If the original filename part contains this line, it's filename
@@ -366,29 +494,7 @@ class CommitDetailsView(ViewScrollMixin):
 
                     # Color the changes part
                     if actual_changes:
-                        change_chars = []
-                        for char in actual_changes:
-                            if char == "+":
-                                change_chars.append((char, COLOR_COMMIT))  # Green for +
-                            elif char == "-":
-                                change_chars.append((char, COLOR_DELETE))  # Red for -
-                            else:
-                                change_chars.append(
-                                    (char, COLOR_DEFAULT)
-                                )  # Default for other chars
-
-                        # Combine consecutive chars with same color
-                        if change_chars:
-                            current_text = change_chars[0][0]
-                            current_color = change_chars[0][1]
-                            for char, color in change_chars[1:]:
-                                if color == current_color:
-                                    current_text += char
-                                else:
-                                    parts.append((current_text, current_color))
-                                    current_text = char
-                                    current_color = color
-                            parts.append((current_text, current_color))
+                        parts.extend(_change_runs(actual_changes))
 
                     colored_lines.append(parts)  # Return list of parts
                 else:
@@ -1,9 +1,13 @@
 """Commit view management for TUI."""
 
 import curses
+import re
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Tuple, Optional, Set, Dict, Union
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from .selection_mixin import VisualSelectionMixin
 from .scrollable_mixin import ScrollableMixin
@@ -11,6 +15,113 @@ from .indicators import SelectionIndicators
 from .text_utils import word_wrap, display_width
 from .color_constants import COLOR_AUTHOR, COLOR_METADATA, COLOR_DEFAULT
 
+# Load the next page once the cursor is this close to the last loaded commit
+PREFETCH_MARGIN = 10
+
+# Row indicators indexed by a bool, so building a row needs no method calls
+_CURSOR_INDICATORS = (SelectionIndicators.CURSOR_NONE, SelectionIndicators.CURSOR_ARROW)
+_SELECTION_BOXES = (SelectionIndicators.UNSELECTED, SelectionIndicators.SELECTED)
+
+# Row prefix split into indicators, datetime (from the first digit through
+# digits, "-", ":" and spaces) and author
+_PREFIX_RE = re.compile(r"(\D+)(\d[\d\-: ]*)(.*)", re.DOTALL)
+
+
+@lru_cache(maxsize=4096)
+def _prefix_parts(prefix: str) -> Tuple[Tuple[str, int], ...]:
+    """Split a commit row prefix into colored parts, memoized per prefix.
+
+    Args:
+        prefix: Row prefix with indicators, datetime and author
+
+    Returns:
+        Tuple of (text, color_pair) parts
+    """
+    match = _PREFIX_RE.fullmatch(prefix)
+    if not match:
+        # No datetime found, treat whole prefix as indicator
+        return ((prefix, COLOR_DEFAULT),)
+
+    indicator_part, datetime_part, author_part = match.groups()
+    parts = [(indicator_part, COLOR_DEFAULT), (datetime_part, COLOR_METADATA)]
+    if author_part:
+        parts.append((author_part, COLOR_AUTHOR))
+    return tuple(parts)
+
+
+@lru_cache(maxsize=4096)
+def _wrap_title(text: str, width: int) -> Tuple[str, ...]:
+    """Word wrap a commit title, memoized per (title, width).
+
+    Args:
+        text: Commit title to wrap
+        width: Maximum width per line
+
+    Returns:
+        Tuple of wrapped lines
+    """
+    return tuple(word_wrap(text, width))
+
+
+@lru_cache(maxsize=4096)
+def _layout_title(
+    subject: str, first_line_width: int, content_width: int, rest_width: int
+) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """Lay out a commit title after its row prefix, memoized per widths.
+
+    Shared by rendering and height calculation so both agree on line counts.
+
+    Args:
+        subject: Commit title
+        first_line_width: Width left for the title on the prefix line
+        content_width: Width of a continuation line
+        rest_width: Width for rewrapping what didn't fit on a partial first line
+
+    Returns:
+        Tuple of (title text for the prefix line, or None if the title starts
+        on the next line, continuation lines)
+    """
+    if first_line_width >= 10 and display_width(subject) <= first_line_width:
+        # Most titles fit after the prefix as-is, no wrapping needed
+        return subject, ()
+
+    wrapped_title = _wrap_title(subject, max(first_line_width, content_width))
+    if not wrapped_title:
+        return None, ()
+
+    first_title_line = wrapped_title[0]
+    if first_line_width < 10:  # Reasonable minimum space for title
+        # Not enough space, put all title lines on next lines
+        return None, wrapped_title
+
+    if display_width(first_title_line) <= first_line_width:
+        # Full first line fits on same line as prefix
+        return first_title_line, wrapped_title[1:]
+
+    # Fit as many words as possible on the first line
+    words = first_title_line.split()
+    line_words = []
+    line_length = 0
+    for word in words:
+        word_width = display_width(word)
+        space_width = 1 if line_words else 0
+        if line_length + word_width + space_width > first_line_width:
+            break
+        line_words.append(word)
+        line_length += word_width + space_width
+
+    if not line_words:
+        # Can't fit any title words, put them on the next line
+        return None, wrapped_title
+
+    remaining_words = words[len(line_words) :]
+    if not remaining_words:
+        return " ".join(line_words), wrapped_title[1:]
+
+    # Rewrap the leftover words together with the rest of the title
+    combined_text = " ".join(remaining_words + list(wrapped_title[1:]))
+    return " ".join(line_words), _wrap_title(combined_text, rest_width)
+
 
 class CommitView(VisualSelectionMixin, ScrollableMixin):
     """Manages commit display and interaction."""
@@ -26,19 +137,50 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
         ScrollableMixin.__init__(self)  # Initialize scrollable mixin
         self.store = store
         self.read_only = read_only
+        # Bumped whenever the loaded commits change, keys the render caches
+        self._commits_revision = 0
         self.commits: List[Dict] = []  # List of commit info dicts
         self.items = self.commits  # Alias for mixin compatibility
         self.cursor_idx = 0  # Primary cursor index for scrollable mixin
-        self.commit_scroll_offset = 0  # Legacy alias
         self.selected_commits: Set[int] = set()  # Legacy alias
         self.selected_items = self.selected_commits  # Point to same set for mixin
         self.commits_with_notes: Set[str] = set()  # Set of SHAs that have notes
+        # store.refs_fingerprint() of the notes at the time they were listed
+        self._notes_fingerprint_loaded: Optional[Tuple] = None
         self.title_scroll_offset = 0  # Horizontal scroll for focused commit
         self.layout_manager = None  # Will be set by app
+        self._page_size = 50  # Commits read per git log call
+        self._has_more = False  # Whether older commits may remain unloaded
+        # (state key, lines) of the last get_display_lines call
+        self._display_cache: Optional[Tuple[Tuple, List]] = None
+        # (key, heights) of the last commit height calculation
+        self._heights_cache: Optional[Tuple[Tuple, List[int]]] = None
 
         # Load commits on initialization
         self.load_commits()
 
+    @property
+    def commits(self) -> List[Dict]:
+        """Loaded commit info dicts, newest first."""
+        return self._commits
+
+    @commits.setter
+    def commits(self, value: List[Dict]) -> None:
+        """Replace the loaded commits."""
+        self._commits = value
+        self._commits_revision += 1
+
+    @property
+    def items(self) -> List:
+        """Items the selection and scroll mixins work on."""
+        return self._items
+
+    @items.setter
+    def items(self, value: List) -> None:
+        """Replace the items the mixins work on."""
+        self._items = value
+        self._commits_revision += 1
+
     @property
     def commit_cursor_idx(self):
         """Legacy property for backward compatibility."""
@@ -49,59 +191,48 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
         """Legacy setter for backward compatibility."""
         self.cursor_idx = value
 
+    @property
+    def commit_scroll_offset(self):
+        """Legacy property for backward compatibility."""
+        return self.scroll_offset
+
+    @commit_scroll_offset.setter
+    def commit_scroll_offset(self, value):
+        """Legacy setter for backward compatibility."""
+        self.scroll_offset = value
+
     def load_commits(self, limit: int = 50) -> None:
         """Load commits from git log.
 
         Args:
-            limit: Maximum number of commits to load initially
+            limit: Commits per page; a reload still keeps every commit
+                already paged in by load_more
         """
         try:
             # Preserve current cursor position
             old_cursor_sha = self.get_cursor_sha()
 
-            # Get list of commits with notes first
-            self.commits_with_notes = set(self.store.list_chats())
-
-            # Get commit log with format: SHA|subject|author|timestamp
-            result = subprocess.run(
-                [
-                    "git",
-                    "log",
-                    "--oneline",
-                    "--date-order",
-                    f"-{limit}",
-                    "--format=%H|%s|%an|%at",
-                ],
-                cwd=self.store.repo_path,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",  # Handle non-UTF8 gracefully
-                check=True,
-            )
+            # Keep commits paged in by load_more across reloads
+            load_limit = max(limit, len(self.commits))
 
-            self.commits = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-
-                parts = line.split("|", 3)
-                if len(parts) >= 4:
-                    sha, subject, author, timestamp = parts
-
-                    # Convert timestamp to datetime
-                    commit_time = datetime.fromtimestamp(int(timestamp))
-
-                    self.commits.append(
-                        {
-                            "sha": sha[:7],  # Short SHA
-                            "full_sha": sha,
-                            "subject": subject,  # Keep full subject for horizontal scrolling
-                            "author": author,
-                            "time": commit_time,
-                            "has_note": sha in self.commits_with_notes,
-                        }
-                    )
+            notes_fingerprint = self.store.refs_fingerprint("refs/notes")
+            if notes_fingerprint is not None and (
+                notes_fingerprint == self._notes_fingerprint_loaded
+            ):
+                # Notes ref untouched since the last load, the set is current
+                log_output = self._run_git_log(load_limit)
+            else:
+                # Listing notes and reading the log are independent git calls,
+                # so list notes in a worker while git log runs here
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    notes_future = executor.submit(self.store.list_chats)
+                    log_output = self._run_git_log(load_limit)
+                    self.commits_with_notes = set(notes_future.result())
+                self._notes_fingerprint_loaded = notes_fingerprint
+
+            self.commits = self._parse_commits(log_output)
+            self._page_size = limit
+            self._has_more = len(self.commits) >= load_limit
 
             # Try to preserve cursor position by finding the same commit SHA
             if old_cursor_sha and self.commits:
@@ -116,7 +247,6 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
                 self.cursor_idx = 0
 
             self.reset_scroll()  # Use scrollable mixin method
-            self.commit_scroll_offset = 0  # Keep legacy alias in sync
             # Update items reference for mixin
             self.items = self.commits
 
@@ -124,9 +254,121 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
             # Handle git errors gracefully
             self.commits = []
             self.items = self.commits
+            self._has_more = False
             # Could be: not a git repo, no commits, or other git issue
             # For debugging, we could log: e.stderr
 
+    def load_more(self, count: Optional[int] = None) -> bool:
+        """Append the next page of older commits.
+
+        Args:
+            count: Number of commits to load (defaults to the initial page size)
+
+        Returns:
+            True if any commits were added
+        """
+        if not self._has_more:
+            return False
+
+        count = count or self._page_size
+        try:
+            more = self._read_commits(count, skip=len(self.commits))
+        except subprocess.CalledProcessError:
+            more = []
+
+        self._has_more = len(more) >= count
+        # Extend in place so self.items keeps pointing at the same list
+        self.commits.extend(more)
+        self._commits_revision += 1
+        return bool(more)
+
+    def _read_commits(self, limit: int, skip: int = 0) -> List[Dict]:
+        """Read a page of commits from git log.
+
+        Args:
+            limit: Maximum number of commits to read
+            skip: Number of newest commits to skip
+
+        Returns:
+            List of commit info dicts
+
+        Raises:
+            subprocess.CalledProcessError: If git log fails
+        """
+        return self._parse_commits(self._run_git_log(limit, skip))
+
+    def _run_git_log(self, limit: int, skip: int = 0) -> str:
+        """Run git log for a page of commits.
+
+        Args:
+            limit: Maximum number of commits to read
+            skip: Number of newest commits to skip
+
+        Returns:
+            Raw git log output, one "SHA|subject|author|timestamp" line per commit
+
+        Raises:
+            subprocess.CalledProcessError: If git log fails
+        """
+        result = subprocess.run(
+            [
+                "git",
+                "log",
+                "--no-color",
+                "--no-decorate",
+                "--date-order",
+                f"--skip={skip}",
+                f"-{limit}",
+                # Unit separators: subjects and author names may contain "|"
+                "--format=%H%x1f%s%x1f%an%x1f%at",
+            ],
+            cwd=self.store.repo_path,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",  # Handle non-UTF8 gracefully
+            check=True,
+        )
+        return result.stdout
+
+    def _parse_commits(self, output: str) -> List[Dict]:
+        """Parse git log output into commit info dicts.
+
+        Args:
+            output: Output of _run_git_log
+
+        Returns:
+            List of commit info dicts
+        """
+        commits = []
+        # Split on newlines only: a subject may contain other line breaks
+        for line in output.split("\n"):
+            if not line:
+                continue
+
+            parts = line.split("\x1f", 3)
+            if len(parts) == 4:
+                sha, subject, author, timestamp = parts
+
+                # Convert timestamp to datetime
+                commit_time = datetime.fromtimestamp(int(timestamp))
+
+                commits.append(
+                    {
+                        "sha": sha[:7],  # Short SHA
+                        "full_sha": sha,
+                        "subject": subject,  # Keep full subject for horizontal scrolling
+                        # Few distinct authors across a long history
+                        "author": sys.intern(author),
+                        "time": commit_time,
+                        # Formatted once here instead of on every render
+                        "datetime_str": self._format_local_datetime(commit_time),
+                        "has_note": sha in self.commits_with_notes,
+                    }
+                )
+
+        return commits
+
     def filter_to_commit(self, commit_sha: str) -> None:
         """Filter commits to only show the specified commit.
 
@@ -147,6 +389,7 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
 
         self.commits = filtered
         self.items = self.commits
+        self._has_more = False
 
         # Auto-select the commit
         if self.commits:
@@ -166,6 +409,10 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
         Returns:
             List of formatted commit lines (strings or color tuple lists)
         """
+        # A pane this short has no content rows inside its borders
+        if height < 3:
+            return []
+
         lines = []
 
         if not self.commits:
@@ -175,8 +422,16 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
                 lines.append("(No commits to display)")
             return lines
 
-        # Calculate commit heights with current width
-        commit_heights = self._calculate_commit_heights(self.commits, width)
+        # Heights depend only on width, mode and the commits themselves: the
+        # cursor, selection and note indicators are fixed-width, so moving the
+        # cursor reuses them instead of re-measuring every loaded commit
+        heights_key = (width, self.read_only, self._commits_revision)
+        cached = self._heights_cache
+        if cached is not None and cached[0] == heights_key:
+            commit_heights = cached[1]
+        else:
+            commit_heights = self._calculate_commit_heights(self.commits, width)
+            self._heights_cache = (heights_key, commit_heights)
 
         # Get visible range using the scrollable mixin's method
         # We'll reserve space for the footer later when building display lines
@@ -184,166 +439,80 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
             height, commit_heights
         )
 
-        # Keep legacy scroll alias for callers that still read it
-        self.commit_scroll_offset = self.scroll_offset
+        # Reuse the previous frame when nothing that affects it has changed.
+        # has_note can be flipped on a commit dict in place, so the flags of
+        # the visible rows are part of the key
+        cache_key = (
+            height,
+            width,
+            colors_enabled,
+            self.read_only,
+            self.cursor_idx,
+            start_idx,
+            end_idx,
+            self.visual_mode,
+            self.visual_start_idx,
+            frozenset(self.selected_items),
+            self._commits_revision,
+            tuple(commit.get("has_note") for commit in self.commits[start_idx:end_idx]),
+        )
+        if self._display_cache is not None and self._display_cache[0] == cache_key:
+            return self._display_cache[1]
+
+        # Selection state is the same for every row, so read it once
+        selected = self.selected_items
+        visual_min, visual_max = self.get_selection_range()
+
+        # Rows between the borders, less the footer line
+        content_rows = height - 3
 
         # Build display lines
         for i in range(start_idx, end_idx):
+            if len(lines) >= content_rows:
+                # Pane is full, anything further would be trimmed below
+                break
             commit = self.commits[i]
+            is_selected = i in selected or (
+                visual_min is not None and visual_min <= i <= visual_max
+            )
 
             # Use unified prefix calculation
             prefix, datetime_indent, first_line_width, content_width = (
-                self._get_commit_prefix_and_widths(i, commit, width)
+                self._get_commit_prefix_and_widths(
+                    i, commit, width, is_selected=is_selected
+                )
             )
-
-            # Wrap the commit title
-            wrapped_title = self._word_wrap_commit_title(
-                commit["subject"], max(first_line_width, content_width)
+            # Indentation shared by all continuation lines of this commit
+            indent = " " * datetime_indent
+
+            first_title_text, title_rest = _layout_title(
+                commit["subject"],
+                first_line_width,
+                content_width,
+                width - datetime_indent - 4,
             )
 
-            if wrapped_title:
-                # Try to fit first part of title on same line as author
-                first_title_line = wrapped_title[0]
-
-                # Check if we can fit at least some of the title on the first line
-                if first_line_width >= 10:  # Reasonable minimum space for title
-                    # Try to fit as much as possible on first line
-                    if display_width(first_title_line) <= first_line_width:
-                        # Full first line fits
-                        if colors_enabled:
-                            lines.append(
-                                self._build_colored_line(
-                                    prefix, first_title_line, datetime_indent
-                                )
-                            )
-                        else:
-                            lines.append(f"{prefix}{first_title_line}")
-                        start_idx = 1
-                    else:
-                        # Split the first line to fit what we can
-                        words = first_title_line.split()
-                        line_words = []
-                        line_length = 0
-
-                        for word in words:
-                            word_width = display_width(word)
-                            space_width = 1 if line_words else 0
-                            if (
-                                line_length + word_width + space_width
-                                <= first_line_width
-                            ):
-                                line_words.append(word)
-                                line_length += word_width + space_width
-                            else:
-                                break
-
-                        if line_words:
-                            # Put partial title on first line
-                            partial_title = " ".join(line_words)
-                            if colors_enabled:
-                                lines.append(
-                                    self._build_colored_line(
-                                        prefix, partial_title, datetime_indent
-                                    )
-                                )
-                            else:
-                                lines.append(f"{prefix}{partial_title}")
-                            # Rewrap remaining text with rest of wrapped title
-                            remaining_words = words[len(line_words) :]
-                            if remaining_words:
-                                # Combine remaining words with rest of wrapped title
-                                combined_text = " ".join(remaining_words)
-                                for idx in range(1, len(wrapped_title)):
-                                    combined_text += " " + wrapped_title[idx]
-                                wrapped_remaining = self._word_wrap_commit_title(
-                                    combined_text, width - datetime_indent - 4
-                                )
-                                for title_line in wrapped_remaining:
-                                    if colors_enabled:
-                                        # Wrapped lines: indentation + title with default color
-                                        lines.append(
-                                            [
-                                                (" " * datetime_indent, COLOR_DEFAULT),
-                                                (title_line, COLOR_DEFAULT),
-                                            ]
-                                        )
-                                    else:
-                                        lines.append(
-                                            f"{' ' * datetime_indent}{title_line}"
-                                        )
-                            else:
-                                # First line partially fits, add rest of wrapped lines
-                                for idx in range(1, len(wrapped_title)):
-                                    if colors_enabled:
-                                        lines.append(
-                                            [
-                                                (" " * datetime_indent, COLOR_DEFAULT),
-                                                (wrapped_title[idx], COLOR_DEFAULT),
-                                            ]
-                                        )
-                                    else:
-                                        lines.append(
-                                            f"{' ' * datetime_indent}{wrapped_title[idx]}"
-                                        )
-                        else:
-                            # Can't fit any title words, put on next line
-                            if colors_enabled:
-                                lines.append(
-                                    self._build_colored_line(
-                                        prefix.rstrip(), "", datetime_indent
-                                    )
-                                )
-                                lines.append(
-                                    [
-                                        (" " * datetime_indent, COLOR_DEFAULT),
-                                        (first_title_line, COLOR_DEFAULT),
-                                    ]
-                                )
-                            else:
-                                lines.append(prefix.rstrip())
-                                lines.append(
-                                    f"{' ' * datetime_indent}{first_title_line}"
-                                )
-                            # Add rest of wrapped lines
-                            for idx in range(1, len(wrapped_title)):
-                                if colors_enabled:
-                                    lines.append(
-                                        [
-                                            (" " * datetime_indent, COLOR_DEFAULT),
-                                            (wrapped_title[idx], COLOR_DEFAULT),
-                                        ]
-                                    )
-                                else:
-                                    lines.append(
-                                        f"{' ' * datetime_indent}{wrapped_title[idx]}"
-                                    )
-                else:
-                    # Not enough space, put all title lines on next lines
-                    if colors_enabled:
-                        lines.append(
-                            self._build_colored_line(
-                                prefix.rstrip(), "", datetime_indent
-                            )
-                        )
-                        for title_line in wrapped_title:
-                            lines.append(
-                                [
-                                    (" " * datetime_indent, COLOR_DEFAULT),
-                                    (title_line, COLOR_DEFAULT),
-                                ]
-                            )
-                    else:
-                        lines.append(prefix.rstrip())
-                        for title_line in wrapped_title:
-                            lines.append(f"{' ' * datetime_indent}{title_line}")
-            else:
-                # No title
+            # Line with indicators, date and author (plus title if it fits)
+            if first_title_text is None:
                 if colors_enabled:
                     lines.append(
                         self._build_colored_line(prefix.rstrip(), "", datetime_indent)
                     )
                 else:
                     lines.append(prefix.rstrip())
+            elif colors_enabled:
+                lines.append(
+                    self._build_colored_line(prefix, first_title_text, datetime_indent)
+                )
+            else:
+                lines.append(prefix + first_title_text)
+
+            # Title continuation lines, indented under the datetime
+            for title_line in title_rest:
+                if colors_enabled:
+                    lines.append([(indent, COLOR_DEFAULT), (title_line, COLOR_DEFAULT)])
+                else:
+                    lines.append(indent + title_line)
 
         # The pane renderer shows height-2 lines (excluding borders)
         available_lines = height - 2
@@ -377,6 +546,7 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
 
         # Visual mode is disabled for single selection, so no indicator needed
 
+        self._display_cache = (cache_key, lines)
         return lines
 
     def handle_input(self, key: int, pane_height: int = 30) -> bool:
@@ -401,6 +571,9 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
                 selection_changed = True
 
         elif key == curses.KEY_DOWN:
+            if self.cursor_idx >= len(self.commits) - PREFETCH_MARGIN:
+                # Page in older commits before the cursor reaches the end
+                self.load_more()
             if self.cursor_idx < len(self.commits) - 1:
                 self.cursor_idx += 1
                 selection_changed = True
@@ -464,55 +637,20 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
         Returns:
             Formatted short datetime string
         """
-        # Short datetime: "09-10 08:18"
-        return commit_time.strftime("%m-%d %H:%M")
-
-    def _format_relative_time(self, commit_time: datetime) -> str:
-        """Format commit time as relative to now.
-
-        Args:
-            commit_time: Datetime of the commit
-
-        Returns:
-            Formatted relative time string
-        """
-        now = datetime.now()
-        diff = now - commit_time
-
-        if diff < timedelta(minutes=1):
-            return "now"
-        elif diff < timedelta(hours=1):
-            mins = int(diff.total_seconds() / 60)
-            return f"{mins}m"
-        elif diff < timedelta(days=1):
-            hours = int(diff.total_seconds() / 3600)
-            return f"{hours}h"
-        elif diff < timedelta(days=7):
-            return f"{diff.days}d"
-        elif diff < timedelta(days=30):
-            weeks = diff.days // 7
-            return f"{weeks}w"
-        elif diff < timedelta(days=365):
-            months = diff.days // 30
-            return f"{months}mo"
-        else:
-            years = diff.days // 365
-            return f"{years}y"
-
-    def _word_wrap_commit_title(self, text: str, width: int) -> List[str]:
-        """Word wrap commit title to specified width.
-
-        Args:
-            text: Commit title to wrap
-            width: Maximum width per line
-
-        Returns:
-            List of wrapped lines
-        """
-        return word_wrap(text, width)
+        # Short datetime: "09-10 08:18" (formatted from the fields directly,
+        # which is about twice as fast as strftime)
+        return (
+            f"{commit_time.month:02d}-{commit_time.day:02d} "
+            f"{commit_time.hour:02d}:{commit_time.minute:02d}"
+        )
 
     def _get_commit_prefix_and_widths(
-        self, i: int, commit: Dict, width: int, is_cursor: bool = None
+        self,
+        i: int,
+        commit: Dict,
+        width: int,
+        is_cursor: bool = None,
+        is_selected: Optional[bool] = None,
     ) -> Tuple[str, int, int, int]:
         """Calculate prefix and widths for a commit - single source of truth.
 
@@ -521,14 +659,14 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
             commit: Commit info dict
             width: Available width for display
             is_cursor: Override cursor check (None = auto-detect, True/False = force)
+            is_selected: Precomputed selection state (None = look it up)
 
         Returns:
             Tuple of (prefix, datetime_indent, first_line_width, content_width)
         """
         # Format indicators
-        is_selected = (
-            self.is_item_selected(i) if hasattr(self, "is_item_selected") else False
-        )
+        if is_selected is None:
+            is_selected = self.is_item_selected(i)
 
         # Use override if provided, otherwise check actual cursor position
         if is_cursor is not None:
@@ -536,38 +674,34 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
         else:
             has_cursor = i == self.cursor_idx
 
-        cursor_indicator = SelectionIndicators.format_cursor(has_cursor, style="arrow")
+        cursor_indicator = _CURSOR_INDICATORS[has_cursor]
         # Hide selection box in read-only mode
-        selection_indicator = (
-            ""
-            if self.read_only
-            else SelectionIndicators.format_selection_box(is_selected)
-        )
+        selection_indicator = "" if self.read_only else _SELECTION_BOXES[is_selected]
 
         # Build prefix with different logic for read-only vs store mode
-        datetime_str = self._format_local_datetime(commit["time"])
+        datetime_str = commit.get("datetime_str")
+        if datetime_str is None:
+            datetime_str = self._format_local_datetime(commit["time"])
+        has_note = commit.get("has_note")
         if self.read_only:
             # Log mode: >• or >* (compact, no extra spaces)
-            note_char = "*" if commit.get("has_note") else "•"
-            prefix = f"{cursor_indicator}{note_char} {datetime_str} {commit['author']} "
+            indicators = "".join((cursor_indicator, "*" if has_note else "•", " "))
         else:
             # Store mode: >[ ] or >[ ]* (space after checkbox for notes)
-            note_indicator = "*" if commit.get("has_note") else " "
-            prefix = f"{cursor_indicator}{selection_indicator}{note_indicator}{datetime_str} {commit['author']} "
+            indicators = "".join(
+                (cursor_indicator, selection_indicator, "*" if has_note else " ")
+            )
+
+        # Date and author never change for a commit, only the indicators do
+        details = "".join((datetime_str, " ", commit["author"], " "))
+        prefix = indicators + details
 
         # visual indent for continuation lines (align with indicators area)
-        if self.read_only:
-            # Log mode: cursor + note_char (>• or >*)
-            note_char = "*" if commit.get("has_note") else "•"
-            datetime_indent = display_width(f"{cursor_indicator}{note_char} ")
-        else:
-            # Store mode: cursor + selection + note
-            note_indicator = "*" if commit.get("has_note") else " "
-            datetime_indent = display_width(
-                f"{cursor_indicator}{selection_indicator}{note_indicator}"
-            )
+        datetime_indent = display_width(indicators)
         # Compute widths using display width (Unicode-aware)
-        first_line_width = max(0, width - display_width(prefix) - 4)  # borders/margins
+        first_line_width = max(
+            0, width - datetime_indent - display_width(details) - 4
+        )  # borders/margins
         content_width = max(0, width - 6)  # continuation width
 
         return prefix, datetime_indent, first_line_width, content_width
@@ -584,74 +718,32 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
         """
         heights = []
 
+        # Selection state is the same for every commit, so read it once
+        selected = self.selected_items
+        visual_min, visual_max = self.get_selection_range()
+
         for i in range(len(commits)):
             commit = commits[i]
+            is_selected = i in selected or (
+                visual_min is not None and visual_min <= i <= visual_max
+            )
             # Start with basic indicators and datetime line
             height = 1
-
             # Use unified prefix calculation - use actual cursor state for accurate height
             # This ensures height calculation matches rendering exactly
             prefix, datetime_indent, first_line_width, content_width = (
-                self._get_commit_prefix_and_widths(i, commit, width)
+                self._get_commit_prefix_and_widths(
+                    i, commit, width, is_selected=is_selected
+                )
             )
 
-            # Wrap the commit title
-            wrapped_title = self._word_wrap_commit_title(
-                commit["subject"], max(first_line_width, content_width)
+            _, title_rest = _layout_title(
+                commit["subject"],
+                first_line_width,
+                content_width,
+                width - datetime_indent - 4,
             )
-
-            if wrapped_title:
-                # Check if first part fits on same line as author
-                first_title_line = wrapped_title[0]
-
-                if first_line_width >= 10:  # Reasonable minimum space for title
-                    if display_width(first_title_line) <= first_line_width:
-                        # Full first line fits on same line as prefix
-                        pass  # height stays 1
-                    else:
-                        # Need to split or move to next line - add extra lines
-                        words = first_title_line.split()
-                        line_words = []
-                        line_length = 0
-
-                        for word in words:
-                            word_width = display_width(word)
-                            space_width = 1 if line_words else 0
-                            if (
-                                line_length + word_width + space_width
-                                <= first_line_width
-                            ):
-                                line_words.append(word)
-                                line_length += word_width + space_width
-                            else:
-                                break
-
-                        if not line_words:
-                            # Can't fit any title words, put on next line
-                            height += 1
-                        # else: partial title fits on first line
-
-                        # Add remaining wrapped lines
-                        remaining_words = (
-                            words[len(line_words) :] if line_words else words
-                        )
-                        if remaining_words:
-                            # Need to account for the rest of the original wrapped title
-                            # Combine remaining words from first line with rest of wrapped title
-                            combined_text = " ".join(remaining_words)
-                            for idx in range(1, len(wrapped_title)):
-                                combined_text += " " + wrapped_title[idx]
-                            wrapped_remaining = self._word_wrap_commit_title(
-                                combined_text, content_width
-                            )
-                            height += len(wrapped_remaining)
-                        else:
-                            # First line partially fits, add rest of wrapped lines
-                            if len(wrapped_title) > 1:
-                                height += len(wrapped_title) - 1
-                else:
-                    # Not enough space, put all title lines on next lines
-                    height += len(wrapped_title)
+            height += len(title_rest)
 
             heights.append(height)
 
@@ -670,77 +762,16 @@ class CommitView(VisualSelectionMixin, ScrollableMixin):
         Returns:
             List of (text, color_pair) tuples for colored rendering
         """
-        parts = []
-
         # Parse prefix to identify components
         # Format in store mode: "[ ]* 09-10 15:30 Author "
         # Format in log mode: ">• 09-10 15:30 Author "
         if not prefix:
             return [(title, COLOR_DEFAULT)] if title else []
 
-        # For read-only mode, format is: ">• datetime author"
-        # For store mode, format is: "[ ]* datetime author"
-
-        # Find the first digit (start of datetime)
-        datetime_start = -1
-        for i, char in enumerate(prefix):
-            if char.isdigit():
-                datetime_start = i
-                break
-
-        if datetime_start > 0:
-            # Everything before datetime is selection/cursor/note indicators
-            indicator_part = prefix[:datetime_start]
-            parts.append((indicator_part, COLOR_DEFAULT))
-
-            # Find where datetime ends (look for next letter after digits/punctuation)
-            datetime_end = datetime_start
-            for i in range(datetime_start, len(prefix)):
-                char = prefix[i]
-                # DateTime contains digits, hyphens, colons, spaces
-                if char.isdigit() or char in "-: ":
-                    datetime_end = i + 1
-                elif char.isalpha():
-                    # Found start of author name
-                    break
-
-            # DateTime part
-            datetime_part = prefix[datetime_start:datetime_end]
-            if datetime_part:
-                parts.append((datetime_part, COLOR_METADATA))
-
-            # Author part (everything after datetime)
-            author_part = prefix[datetime_end:]
-            if author_part:
-                parts.append((author_part, COLOR_AUTHOR))
-        else:
-            # No datetime found, treat whole prefix as indicator
-            parts.append((prefix, COLOR_DEFAULT))
+        parts = list(_prefix_parts(prefix))
 
         # Add title with default color
         if title:
             parts.append((title, COLOR_DEFAULT))
 
         return parts
-
-    def _visible_commit_items(self, height: int) -> int:
-        """Calculate how many commit items can fit in the given height.
-
-        This is a simplified version that estimates based on average item height.
-        Similar to MessageView's _visible_message_items.
-
-        Args:
-            height: Screen height
-
-        Returns:
-            Number of commit items that can be displayed
-        """
-        # Rows available for content between borders
-        rows = max(0, height - 2)
-
-        # No visual mode in single selection, so no extra rows needed
-
-        # Estimate based on average lines per commit
-        # Most commits take 1 line, some wrap to 2-8 lines
-        AVERAGE_LINES_PER_COMMIT = 2
-        return max(1, rows // AVERAGE_LINES_PER_COMMIT)
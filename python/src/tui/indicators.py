@@ -14,6 +14,13 @@ class SelectionIndicators:
     CURSOR_BULLET = "•"
     CURSOR_NONE = " "
 
+    # Cursor indicator per format_cursor style
+    CURSOR_STYLES = {
+        "arrow": CURSOR_ARROW,
+        "triangle": CURSOR_TRIANGLE,
+        "bullet": CURSOR_BULLET,
+    }
+
     # Visual mode indicators
     VISUAL_MODE = "-- VISUAL --"
 
@@ -48,9 +55,6 @@ class SelectionIndicators:
         if not is_current:
             return SelectionIndicators.CURSOR_NONE if pad else ""
 
-        styles = {
-            "arrow": SelectionIndicators.CURSOR_ARROW,
-            "triangle": SelectionIndicators.CURSOR_TRIANGLE,
-            "bullet": SelectionIndicators.CURSOR_BULLET,
-        }
-        return styles.get(style, SelectionIndicators.CURSOR_ARROW)
+        return SelectionIndicators.CURSOR_STYLES.get(
+            style, SelectionIndicators.CURSOR_ARROW
+        )
@@ -31,7 +31,7 @@ class LayoutManager:
     def calculate_column_widths(
         self,
         screen_width: int,
-        commit_titles: List[str],
+        commit_titles: Optional[List[str]] = None,
         log_count: int = 0,
         read_only_mode: bool = False,
     ) -> Tuple[int, int, int]:
@@ -39,7 +39,8 @@ class LayoutManager:
 
         Args:
             screen_width: Total screen width available
-            commit_titles: List of commit titles for width calculation
+            commit_titles: Unused, titles soft-wrap so widths don't depend on
+                them; accepted for existing callers
             log_count: Number of log entries (0 if no logs)
             read_only_mode: If True, use shorter prefix (tigs view), else use checkbox prefix (tigs store)
 
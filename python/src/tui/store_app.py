@@ -262,8 +262,6 @@ class TigsStoreApp:
 
             else:
                 # 3-PANE LAYOUT (Commits | Messages | Logs)
-                # Get commit titles for width calculation
-                commit_titles = [c["subject"] for c in self.commit_view.commits]
                 log_count = len(self.log_view.logs) if self.log_view.logs else 0
 
                 # Calculate dynamic widths
@@ -271,8 +269,7 @@ class TigsStoreApp:
                     commit_width, message_width, log_width = (
                         self.layout_manager.calculate_column_widths(
                             width,
-                            commit_titles,
-                            log_count,
+                            log_count=log_count,
                             read_only_mode=False,  # Full prefix with checkboxes
                         )
                     )
@@ -2,13 +2,18 @@
 
 import os
 import sys
+from functools import lru_cache
 from typing import List, Iterable
 from wcwidth import wcswidth
 
 
+@lru_cache(maxsize=8192)
 def display_width(text: str) -> int:
     """Calculate the display width of text accounting for Unicode, emoji, etc.
 
+    Memoized, since the same words, authors and prefixes are measured on
+    every frame.
+
     Args:
         text: Text to measure
 
@@ -17,6 +22,9 @@ def display_width(text: str) -> int:
     """
     if not text:
         return 0
+    # Printable ASCII is one column per character, skip the wcwidth tables
+    if text.isascii() and text.isprintable():
+        return len(text)
     w = wcswidth(text)
     # wcswidth can return -1 on unprintables; treat as 0 columns so we don't go negative
     return max(w, 0) if w is not None else 0
@@ -3,6 +3,7 @@
 import curses
 import os
 import sys
+from typing import List
 
 from .commits_view import CommitView
 from .commit_details_view import CommitDetailsView
@@ -29,6 +30,8 @@ class TigsViewApp:
         self.running = True
         self._colors_enabled = False
         self.focused_pane = 0  # 0=commits, 1=details, 2=chat
+        self._cursor_moved = False  # Details/chat lag the commit cursor
+        self._last_frame = None  # What is currently on screen
 
         # Initialize layout manager
         self.layout_manager = LayoutManager()
@@ -198,28 +201,18 @@ class TigsViewApp:
                 except curses.error:
                     pass
                 stdscr.refresh()
+                self._last_frame = None
                 key = stdscr.getch()
                 if key == ord("q") or key == ord("Q"):
                     self.running = False
                 continue
 
-            # Clear iTerm2 scrollback buffer + standard curses clear
-            clear_iterm2_scrollback()
-            stdscr.clear()
-
             # Calculate column widths using layout manager for consistency with store
-            commit_titles = (
-                [c["subject"] for c in self.commit_view.commits]
-                if self.commit_view.commits
-                else []
-            )
-
             if self.layout_manager.needs_recalculation(width):
                 commit_width, remaining_width, _ = (
                     self.layout_manager.calculate_column_widths(
                         width,
-                        commit_titles,
-                        0,
+                        log_count=0,
                         read_only_mode=True,  # No log column, shorter prefix in log view
                     )
                 )
@@ -243,73 +236,156 @@ class TigsViewApp:
                 pane_height, chat_width, self._colors_enabled
             )
 
-            # Draw panes with focus state using PaneRenderer
-            PaneRenderer.draw_pane(
-                stdscr,
-                0,
-                0,
-                pane_height,
+            # Keys that change nothing (e.g. moving past the last commit)
+            # leave the screen as drawn instead of repainting it
+            frame = (
+                height,
+                width,
+                self.focused_pane,
                 commit_width,
-                "Commits",
-                self.focused_pane == 0,
                 commit_lines,
-                self._colors_enabled,
-            )
-            PaneRenderer.draw_pane(
-                stdscr,
-                0,
-                commit_width,
-                pane_height,
-                details_width,
-                "Commit Details",
-                self.focused_pane == 1,
                 details_lines,
-                self._colors_enabled,
-            )
-            PaneRenderer.draw_pane(
-                stdscr,
-                0,
-                commit_width + details_width,
-                pane_height,
-                chat_width,
-                "Chat",
-                self.focused_pane == 2,
                 chat_lines,
-                self._colors_enabled,
             )
+            if frame != self._last_frame:
+                self._last_frame = frame
+                self._draw_frame(
+                    stdscr,
+                    height,
+                    width,
+                    commit_width,
+                    details_width,
+                    chat_width,
+                    commit_lines,
+                    details_lines,
+                    chat_lines,
+                )
 
-            # Draw status bar
-            self._draw_status_bar(stdscr, height - 1, width)
-
-            # Refresh to show everything
-            stdscr.refresh()
-
-            # Handle input
-            key = stdscr.getch()
-            if key == ord("q") or key == ord("Q"):
-                self.running = False
-            elif key == ord("\t"):  # Tab
-                self.focused_pane = (self.focused_pane + 1) % 3
-            elif key == curses.KEY_BTAB or key == 353:  # Shift-Tab
-                self.focused_pane = (self.focused_pane - 1) % 3
-            elif key == curses.KEY_RESIZE:
-                continue
-            else:
-                # Route input to focused pane
-                if self.focused_pane == 0:
-                    # Commits pane - existing cursor navigation
-                    if self.commit_view.handle_input(key, pane_height):
-                        # Cursor moved, update other views
-                        sha = self.commit_view.get_cursor_sha()
-                        if sha:
-                            self.commit_details_view.load_commit_details(sha)
-                            self._load_chat_for_commit(sha)
-                elif self.focused_pane == 1:
-                    # Details pane - view scrolling
-                    self.commit_details_view.handle_input(key, pane_height)
-                elif self.focused_pane == 2:
-                    # Chat pane - view scrolling
-                    self.message_view.handle_input(None, key, pane_height)
+            # Handle input, then drain keys queued while drawing so a held
+            # navigation key costs one redraw and one details load per batch
+            self._handle_key(stdscr.getch(), pane_height)
+            stdscr.nodelay(True)
+            try:
+                while self.running:
+                    key = stdscr.getch()
+                    if key == -1:
+                        break
+                    self._handle_key(key, pane_height)
+            finally:
+                stdscr.nodelay(False)
+            self._sync_cursor_views()
+
+    def _draw_frame(
+        self,
+        stdscr,
+        height: int,
+        width: int,
+        commit_width: int,
+        details_width: int,
+        chat_width: int,
+        commit_lines: List,
+        details_lines: List,
+        chat_lines: List,
+    ) -> None:
+        """Repaint all panes and the status bar.
+
+        Args:
+            stdscr: The curses screen
+            height: Height of screen
+            width: Width of screen
+            commit_width: Width of the commits pane
+            details_width: Width of the details pane
+            chat_width: Width of the chat pane
+            commit_lines: Display lines for the commits pane
+            details_lines: Display lines for the details pane
+            chat_lines: Display lines for the chat pane
+        """
+        pane_height = height - 1
+
+        # Clear iTerm2 scrollback buffer + standard curses clear
+        clear_iterm2_scrollback()
+        stdscr.clear()
+
+        # Draw panes with focus state using PaneRenderer
+        PaneRenderer.draw_pane(
+            stdscr,
+            0,
+            0,
+            pane_height,
+            commit_width,
+            "Commits",
+            self.focused_pane == 0,
+            commit_lines,
+            self._colors_enabled,
+        )
+        PaneRenderer.draw_pane(
+            stdscr,
+            0,
+            commit_width,
+            pane_height,
+            details_width,
+            "Commit Details",
+            self.focused_pane == 1,
+            details_lines,
+            self._colors_enabled,
+        )
+        PaneRenderer.draw_pane(
+            stdscr,
+            0,
+            commit_width + details_width,
+            pane_height,
+            chat_width,
+            "Chat",
+            self.focused_pane == 2,
+            chat_lines,
+            self._colors_enabled,
+        )
+
+        # Draw status bar
+        self._draw_status_bar(stdscr, height - 1, width)
+
+        # Refresh to show everything
+        stdscr.refresh()
+
+    def _handle_key(self, key: int, pane_height: int) -> None:
+        """Apply a single key press to the app or the focused pane.
+
+        Args:
+            key: The key code read from curses
+            pane_height: Height of the panes in rows
+        """
+        if key == ord("q") or key == ord("Q"):
+            self.running = False
+        elif key == ord("\t"):  # Tab
+            self.focused_pane = (self.focused_pane + 1) % 3
+        elif key == curses.KEY_BTAB or key == 353:  # Shift-Tab
+            self.focused_pane = (self.focused_pane - 1) % 3
+        elif key == curses.KEY_RESIZE:
+            return
+        elif self.focused_pane == 0:
+            # Commits pane - existing cursor navigation
+            if self.commit_view.handle_input(key, pane_height):
+                # Cursor moved, other views follow once the keys are drained
+                self._cursor_moved = True
+        else:
+            # Other panes scroll content that must match the cursor commit
+            self._sync_cursor_views()
+            if self.focused_pane == 1:
+                # Details pane - view scrolling
+                self.commit_details_view.handle_input(key, pane_height)
+            elif self.focused_pane == 2:
+                # Chat pane - view scrolling
+                self.message_view.handle_input(None, key, pane_height)
+
+    def _sync_cursor_views(self) -> None:
+        """Load details and chat for the commit cursor if it has moved."""
+        if not self._cursor_moved:
+            return
+        self._cursor_moved = False
+        sha = self.commit_view.get_cursor_sha()
+        if sha:
+            self.commit_details_view.load_commit_details(sha)
+            self._load_chat_for_commit(sha)
 
     def _draw_status_bar(self, stdscr, y: int, width: int) -> None:
         """Draw the status bar.
@@ -1,8 +1,11 @@
 """Edge case tests for commit details view to prevent regressions."""
 
+import subprocess
+
 import pytest
 from unittest.mock import Mock, patch
 
+from src.storage import TigsRepo
 from src.tui.commit_details_view import CommitDetailsView
 
 
@@ -210,6 +213,128 @@ AuthorDate: Tue Sep 11 10:00:00 2025 +0800
             assert not found_first, "Should not find first file after commit change"
             assert found_second, "Should find second commit's content"
 
+    def test_rewrap_after_width_change_uses_original_lines(self):
+        """Test that widening the pane re-joins lines wrapped at a narrow width."""
+        git_output = """commit abc123
+Author:     Test <test@test.com>
+AuthorDate: Mon Sep 10 14:30:00 2025 +0800
+
+    A commit message that is long enough to wrap in a narrow details pane
+    
+ file.txt | 2 ++
+ 1 file changed, 2 insertions(+)"""
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = git_output
+
+            self.view.load_commit_details("abc123")
+            narrow = self.view.get_display_lines(height=40, width=30)
+            wide = self.view.get_display_lines(height=40, width=120)
+
+            assert len(narrow) > len(wide)
+            assert (
+                "    A commit message that is long enough to wrap in a narrow "
+                "details pane" in wide
+            )
+
+    def test_revisiting_commit_uses_cached_details(self):
+        """Test that returning to a viewed commit does not run git again."""
+        git_output = """commit abc123
+Author:     Test <test@test.com>
+AuthorDate: Mon Sep 10 14:30:00 2025 +0800
+
+    Cached commit
+"""
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = git_output
+
+            self.view.load_commit_details("abc123")
+            self.view.load_commit_details("def456")
+            calls = mock_run.call_count
+
+            self.view.load_commit_details("abc123")
+
+            assert mock_run.call_count == calls
+            assert "    Cached commit" in self.view.get_display_lines(
+                height=20, width=80
+            )
+
+    def test_refs_are_read_once_until_invalidated(self):
+        """Test that refs are fetched once and shared across commits."""
+        show_result = Mock(returncode=0, stdout="commit abc123\n")
+        refs_result = Mock(
+            returncode=0,
+            stdout="abc123 refs/heads/main\n"
+            "tag999 refs/tags/v1.0 def456\n"
+            "def456 refs/remotes/origin/main\n",
+        )
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [show_result, refs_result, show_result]
+
+            self.view.load_commit_details("abc123")
+            assert "Refs: [main]" in self.view.total_lines
+
+            self.view.load_commit_details("def456")
+            assert "Refs: <v1.0>, {origin/main}" in self.view.total_lines
+            assert mock_run.call_count == 3
+
+            self.view.invalidate_refs()
+            mock_run.side_effect = [show_result, refs_result]
+            self.view.current_sha = None
+            self.view.load_commit_details("abc123")
+            assert mock_run.call_count == 5
+
+    def test_refs_reread_when_storage_cannot_be_inspected(self):
+        """Test that refs aren't cached when there is no ref fingerprint."""
+        self.mock_store.refs_fingerprint.return_value = None
+        show_result = Mock(returncode=0, stdout="commit abc123\n")
+        refs_result = Mock(returncode=0, stdout="abc123 refs/heads/main\n")
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [show_result, refs_result] * 3
+
+            self.view.load_commit_details("abc123")
+            self.view.load_commit_details("def456")
+            self.view.load_commit_details("abc123")
+            assert mock_run.call_count == 6
+            assert "Refs: [main]" in self.view.total_lines
+
+    @pytest.mark.parametrize("subdir", ["", "src"])
+    def test_refs_created_while_open_are_shown(self, tmp_path, subdir):
+        """Test that a branch created after the refs were read shows up."""
+
+        def git(*args):
+            return subprocess.run(
+                ["git", "-c", "user.name=Test", "-c", "user.email=test@test.com"]
+                + list(args),
+                cwd=tmp_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+
+        git("init", "-q")
+        git("commit", "-q", "--allow-empty", "-m", "First")
+        git("commit", "-q", "--allow-empty", "-m", "Second")
+        head, parent = git("rev-parse", "HEAD", "HEAD~1").split()
+        (tmp_path / subdir).mkdir(exist_ok=True)
+        self.view.store = TigsRepo(tmp_path / subdir)
+
+        self.view.load_commit_details(head)
+        self.view.load_commit_details(parent)
+        assert not any("feature" in line for line in self.view.total_lines)
+
+        git("branch", "feature", parent)
+        git("tag", "v1.0", head)
+        self.view.load_commit_details(head)
+        assert any("<v1.0>" in line for line in self.view.total_lines)
+        self.view.load_commit_details(parent)
+        assert any("[feature]" in line for line in self.view.total_lines)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,5 +1,6 @@
 """Tests for status footer in commits view."""
 
+import curses
 from unittest.mock import Mock, patch
 from datetime import datetime
 
@@ -213,3 +214,71 @@ class TestCommitsStatusFooter:
 
         # Footer might not appear if no room, or might appear if there's space
         # Either case is acceptable - footer is optional if no space
+
+    def test_collapsed_pane_has_no_lines(self):
+        """Test that a pane with no room inside its borders gets no lines."""
+        for height in (0, 1, 2):
+            assert self.view.get_display_lines(height=height, width=80) == []
+
+    def test_status_footer_total_grows_when_paging(self):
+        """Test that moving past the last commit pages in older ones."""
+        self.view.commits = []
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.stdout = "a1\x1fFirst\x1fAuthor\x1f1734567890\n"
+            mock_run.return_value.stdout += "b2\x1fSecond\x1fAuthor\x1f1734567800\n"
+            self.view.load_commits(limit=2)
+            assert len(self.view.commits) == 2
+
+            mock_run.return_value.stdout = "c3\x1fThird\x1fAuthor\x1f1734567700\n"
+            self.view.handle_input(curses.KEY_DOWN)
+            self.view.handle_input(curses.KEY_DOWN)
+
+            assert "--skip=2" in mock_run.call_args[0][0]
+            assert self.view.cursor_idx == 2
+            lines = self.view.get_display_lines(height=20, width=80)
+            assert "(3/3)" in lines[-1]
+
+            # A short page means history is exhausted
+            self.view.handle_input(curses.KEY_DOWN)
+            assert mock_run.call_count == 2
+
+    def test_next_page_loads_before_cursor_reaches_end(self):
+        """Test that older commits are paged in ahead of the cursor."""
+        self.view.commits = []
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.stdout = "".join(
+                f"{i:040x}\x1fCommit {i}\x1fAuthor\x1f{1734567890 - i}\n"
+                for i in range(30)
+            )
+            self.view.load_commits(limit=30)
+            self.view.cursor_idx = 19
+
+            self.view.handle_input(curses.KEY_DOWN)
+            assert mock_run.call_count == 1
+
+            self.view.handle_input(curses.KEY_DOWN)
+            assert mock_run.call_count == 2
+            assert "--skip=30" in mock_run.call_args[0][0]
+            assert self.view.cursor_idx == 21
+            assert len(self.view.commits) == 60
+
+    def test_reload_keeps_page_size(self):
+        """Test that reloading paged-in history doesn't grow later pages."""
+        self.view.commits = []
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.stdout = "".join(
+                f"{i:040x}\x1fCommit {i}\x1fAuthor\x1f{1734567890 - i}\n"
+                for i in range(30)
+            )
+            self.view.load_commits(limit=30)
+            self.view.load_more()
+            assert len(self.view.commits) == 60
+
+            # A reload (e.g. after storing a chat) re-reads everything shown
+            mock_run.return_value.stdout *= 2
+            self.view.load_commits(limit=30)
+            assert "-60" in mock_run.call_args[0][0]
+
+            self.view.load_more()
+            assert "-30" in mock_run.call_args[0][0]
+            assert "--skip=60" in mock_run.call_args[0][0]
@@ -234,6 +234,72 @@ class TestCommitsViewColors:
         assert all(c == COLOR_AUTHOR for c in alice_colors_wide)
         assert all(c == COLOR_AUTHOR for c in alice_colors_narrow)
 
+    def test_display_lines_reused_until_state_changes(self):
+        """Test that unchanged state reuses lines and state changes rebuild them."""
+        first = self.view.get_display_lines(height=20, width=80)
+        assert self.view.get_display_lines(height=20, width=80) is first
+
+        self.view.commits[0]["has_note"] = True
+        with_note = self.view.get_display_lines(height=20, width=80)
+        assert with_note is not first
+        assert "*" in with_note[0][:5]
+
+        self.view.selected_commits.add(0)
+        selected = self.view.get_display_lines(height=20, width=80)
+        assert "[x]" in selected[0]
+
+    def test_display_lines_rebuilt_for_replaced_commits(self):
+        """Test that a new commit list of the same length rebuilds the lines."""
+        first = self.view.get_display_lines(height=20, width=80)
+        self.view.commits = [
+            dict(commit, subject=commit["subject"] + " again")
+            for commit in self.view.commits
+        ]
+        self.view.items = self.view.commits
+
+        lines = self.view.get_display_lines(height=20, width=80)
+        assert lines != first
+        assert "Add new feature again" in lines[0]
+
+    def test_commit_heights_reused_across_cursor_moves(self):
+        """Test that moving the cursor doesn't re-measure every commit."""
+        with patch.object(
+            self.view,
+            "_calculate_commit_heights",
+            wraps=self.view._calculate_commit_heights,
+        ) as calculate:
+            self.view.get_display_lines(height=20, width=80)
+            self.view.cursor_idx = 2
+            self.view.get_display_lines(height=20, width=80)
+            assert calculate.call_count == 1
+
+            self.view.get_display_lines(height=20, width=60)
+            assert calculate.call_count == 2
+
+    def test_commit_heights_match_rendered_lines(self):
+        """Test that height calculation counts the lines rendering produces."""
+        # A title too wide for any line and one that only partly fits
+        self.view.commits[1]["subject"] = "x" * 120
+        self.view.commits[2]["subject"] = (
+            "supercalifragilisticexpialidocious and more words following it here"
+        )
+        for width in (45, 60, 80):
+            heights = self.view._calculate_commit_heights(self.view.commits, width)
+            lines = self.view.get_display_lines(height=40, width=width)
+            assert lines[sum(heights) - 1].strip()
+            assert not lines[sum(heights)].strip()
+
+    def test_title_rest_rendered_after_fitting_first_line(self):
+        """Test that wrapped title text after a fitting first line is drawn."""
+        self.view.commits[0]["subject"] = "short words here " + "y" * 30
+
+        lines = self.view.get_display_lines(height=20, width=45)
+
+        assert lines[0].endswith("short words here")
+        assert lines[1] == "     " + "y" * 30
+        heights = self.view._calculate_commit_heights(self.view.commits, 45)
+        assert heights[0] == 2
+
     def test_build_colored_line_helper(self):
         """Test the _build_colored_line helper method."""
         # Test with typical prefix (format: selection datetime author)
@@ -52,6 +52,16 @@ class TestLayoutManager:
         assert commit_w <= self.layout.MAX_COMMIT_WIDTH
         assert msg_w >= self.layout.MIN_MESSAGE_WIDTH
 
+    def test_calculate_widths_without_titles(self):
+        """Test that widths don't need the commit titles."""
+        titles = ["Short", "A" * 200]
+        for read_only in (False, True):
+            assert self.layout.calculate_column_widths(
+                120, log_count=5, read_only_mode=read_only
+            ) == self.layout.calculate_column_widths(
+                120, titles, 5, read_only_mode=read_only
+            )
+
     def test_calculate_widths_empty_titles(self):
         """Test with empty titles list."""
         commit_w, msg_w, log_w = self.layout.calculate_column_widths(100, [], 5)
@@ -62,6 +62,44 @@ class TestTUIStoreEndToEnd:
             message = commit.get("message") or commit.get("subject")
             assert len(message) > 0
 
+    @pytest.mark.parametrize("subdir", ["", "src"])
+    def test_reload_skips_notes_listing_until_notes_change(self, git_repo, subdir):
+        """Test that reloading commits only re-lists notes after they change."""
+        (git_repo / subdir).mkdir(exist_ok=True)
+        store = TigsRepo(git_repo / subdir)
+        view = CommitView(store)
+        assert not view.commits[0]["has_note"]
+
+        with patch.object(store, "list_chats", wraps=store.list_chats) as list_chats:
+            view.load_commits()
+            assert list_chats.call_count == 0
+
+            store.add_chat("HEAD", "schema: tigs.chat/v1\nmessages: []\n")
+            view.load_commits()
+            assert list_chats.call_count == 1
+            assert view.commits[0]["has_note"]
+
+    def test_commit_with_pipes_in_subject_and_author(self, git_repo):
+        """Test that "|" in a subject or author name doesn't shift fields."""
+        subprocess.run(
+            [
+                "git",
+                "commit",
+                "--allow-empty",
+                "-m",
+                "Fix a | b",
+                "--author=A | B <ab@example.com>",
+            ],
+            cwd=git_repo,
+            check=True,
+            capture_output=True,
+        )
+        view = CommitView(TigsRepo(git_repo))
+
+        commit = view.commits[0]
+        assert commit["subject"] == "Fix a | b"
+        assert commit["author"] == "A | B"
+
     def test_store_operation_error_handling_real_git(
         self, git_repo, sample_yaml_content
     ):
@@ -315,7 +353,9 @@ class TestTUIDynamicLayout:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Test commit|Author|1234567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fTest commit\x1fAuthor\x1f1234567890"
+            )
 
             app = TigsStoreApp(mock_store)
 
@@ -344,7 +384,7 @@ class TestTUIDynamicLayout:
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
             mock_run.return_value.stdout = (
-                "abc123|" + ("A" * 100) + "|Author|1234567890"
+                "abc123\x1f" + ("A" * 100) + "\x1fAuthor\x1f1234567890"
             )
 
             view = CommitView(mock_store)
@@ -380,7 +420,9 @@ class TestTUIDynamicLayout:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Short title|TestAuthor|1734567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fShort title\x1fTestAuthor\x1f1734567890"
+            )
 
             view = CommitView(mock_store)
 
@@ -420,7 +462,7 @@ class TestTUIDynamicLayout:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Short subject|Author|1234567890\ndef456|Very long subject that should affect width calculation|Author|1234567890"
+            mock_run.return_value.stdout = "abc123\x1fShort subject\x1fAuthor\x1f1234567890\ndef456\x1fVery long subject that should affect width calculation\x1fAuthor\x1f1234567890"
 
             app = TigsStoreApp(mock_store)
 
@@ -457,7 +499,9 @@ class TestTUIDynamicLayout:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Test commit|Author|1234567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fTest commit\x1fAuthor\x1f1234567890"
+            )
 
             app = TigsStoreApp(mock_store)
 
@@ -501,7 +545,9 @@ class TestTUIDynamicLayout:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Test commit|Author|1234567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fTest commit\x1fAuthor\x1f1234567890"
+            )
 
             app = TigsStoreApp(mock_store)
 
@@ -543,7 +589,9 @@ class TestTUIDynamicLayout:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Test commit|Author|1234567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fTest commit\x1fAuthor\x1f1234567890"
+            )
 
             app = TigsStoreApp(mock_store)
             app.chat_parser = None
@@ -566,7 +614,7 @@ class TestTUIDynamicLayout:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|This is a very long commit subject that should be handled properly|Author|1234567890"
+            mock_run.return_value.stdout = "abc123\x1fThis is a very long commit subject that should be handled properly\x1fAuthor\x1f1234567890"
 
             view = CommitView(mock_store)
 
@@ -18,7 +18,9 @@ class TestViewAppIntegration:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Test commit|Author|1234567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fTest commit\x1fAuthor\x1f1234567890"
+            )
 
             app = TigsViewApp(store)
 
@@ -100,7 +102,9 @@ class TestViewAppIntegration:
 
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Test commit|Author|1234567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fTest commit\x1fAuthor\x1f1234567890"
+            )
 
             app = TigsViewApp(store)
 
@@ -173,3 +177,55 @@ class TestViewAppIntegration:
             else:
                 status_text = "↑/↓: scroll | Tab: switch pane | q: quit"
             assert status_text == expected
+
+    def test_queued_keys_load_details_once(self, git_repo):
+        """Test that a burst of navigation keys reloads details only once."""
+        store = TigsRepo(git_repo)
+
+        with patch("subprocess.run"):
+            app = TigsViewApp(store)
+
+            app.commit_view = Mock()
+            app.commit_details_view = Mock()
+            app.commit_view.handle_input.return_value = True
+            app.commit_view.get_cursor_sha.return_value = "abc123"
+
+            with patch.object(app, "_load_chat_for_commit") as load_chat:
+                for _ in range(5):
+                    app._handle_key(curses.KEY_DOWN, 30)
+                app.commit_details_view.load_commit_details.assert_not_called()
+
+                app._sync_cursor_views()
+                app._sync_cursor_views()
+
+                app.commit_details_view.load_commit_details.assert_called_once_with(
+                    "abc123"
+                )
+                load_chat.assert_called_once_with("abc123")
+
+                # Scrolling another pane first catches it up with the cursor
+                app._handle_key(curses.KEY_DOWN, 30)
+                app.focused_pane = 1
+                app._handle_key(curses.KEY_DOWN, 30)
+                assert app.commit_details_view.load_commit_details.call_count == 2
+                app.commit_details_view.handle_input.assert_called_once_with(
+                    curses.KEY_DOWN, 30
+                )
+
+    def test_unchanged_frame_is_not_redrawn(self, git_repo):
+        """Test that a key which changes nothing doesn't repaint the screen."""
+        store = TigsRepo(git_repo)
+        app = TigsViewApp(store)
+
+        mock_stdscr = Mock()
+        mock_stdscr.getmaxyx.return_value = (30, 120)
+        # An unbound key, then the drain finds the queue empty, then quit
+        mock_stdscr.getch.side_effect = [ord("z"), -1, ord("q"), -1]
+
+        with patch("curses.curs_set"), patch("curses.noecho"):
+            with patch("curses.has_colors", return_value=False):
+                with patch("src.tui.view_app.PaneRenderer") as renderer:
+                    app._run(mock_stdscr)
+
+        assert mock_stdscr.clear.call_count == 1
+        assert renderer.draw_pane.call_count == 3
@@ -236,7 +236,9 @@ class TestCommitViewSelection:
         # Mock subprocess to avoid actual git calls
         with patch("subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = "abc123|Test commit|Author|1234567890"
+            mock_run.return_value.stdout = (
+                "abc123\x1fTest commit\x1fAuthor\x1f1234567890"
+            )
             self.view = CommitView(self.mock_store)
 
     def test_commit_view_initialization(self):